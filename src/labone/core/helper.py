@@ -3,11 +3,16 @@
 This module bypasses the circular dependency between the modules
 within the core.
 """
+from __future__ import annotations
+
 from enum import IntEnum
+from typing import TYPE_CHECKING
 
-import capnp
 import numpy as np
-from typing_extensions import TypeAlias
+
+if TYPE_CHECKING:
+    import capnp
+    from typing_extensions import TypeAlias
 
 LabOneNodePath: TypeAlias = str
 
@@ -25,6 +30,58 @@ def request_field_type_description(
     return request.schema.fields[field].proto.slot.type.which()
 
 
+def data_field_view(
+    struct: capnp.lib.capnp._DynamicStructReader,  # noqa: SLF001
+    field: str,
+) -> memoryview:
+    """Get a memoryview on a capnp `Data` field.
+
+    Accessing a `Data` field directly copies its content into a new `bytes`
+    object. Newer pycapnp versions allow exporting the underlying segment
+    memory without copying, which is used if available.
+
+    Warning:
+        The view does not keep the capnp message alive. Messages received
+        through RPC (e.g. streamed values) are released once the call
+        returns. Everything that outlives the call must be copied out of
+        the view.
+
+    Args:
+        struct: Capnp struct containing the field.
+        field: Name of the `Data` field.
+
+    Returns:
+        Memoryview on the field content. It is read-only for struct readers
+        and writable for struct builders.
+    """
+    try:
+        return struct.get_data_as_view(field)
+    except AttributeError:
+        # pycapnp versions without buffer export support.
+        return memoryview(getattr(struct, field))
+
+
+def array_from_data_view(data: bytes | memoryview, dtype: np.dtype) -> np.ndarray:
+    """Create a numpy array from a view returned by `data_field_view`.
+
+    A view on exported capnp memory is copied once into an owned array, since
+    the capnp message may be released after the call. `bytes` and views on a
+    `bytes` copy (pycapnp versions without buffer export) are used as is, the
+    array keeps the `bytes` object alive through its base.
+
+    Args:
+        data: Content of a capnp `Data` field (or a slice of it).
+        dtype: Numpy type of the array elements.
+
+    Returns:
+        Numpy array that stays valid independent of the capnp message.
+    """
+    array = np.frombuffer(data, dtype=dtype)
+    if isinstance(data, bytes) or isinstance(data.obj, bytes):
+        return array
+    return array.copy()
+
+
 class VectorValueType(IntEnum):
     """Mapping of the vector value type.
 
@@ -64,9 +121,35 @@ class VectorElementType(IntEnum):
     def from_numpy_type(
         cls,
         numpy_type: np.dtype,
-    ) -> "VectorElementType":
+    ) -> VectorElementType:
         """Construct a VectorElementType from a numpy type.
 
+        Args:
+            numpy_type: The numpy type to be converted.
+
+        Returns:
+            The VectorElementType corresponding to the numpy type.
+
+        Raises:
+            ValueError: If the numpy type has no corresponding
+                VectorElementType.
+        """
+        dtype = np.dtype(numpy_type)
+        try:
+            return _NUMPY_TO_CAPNP_TYPE[dtype]
+        except KeyError:
+            pass
+        element_type = cls._resolve_numpy_type(dtype)
+        _NUMPY_TO_CAPNP_TYPE[dtype] = element_type
+        return element_type
+
+    @classmethod
+    def _resolve_numpy_type(
+        cls,
+        numpy_type: np.dtype,
+    ) -> VectorElementType:
+        """Resolve the VectorElementType through the numpy type hierarchy.
+
         Args:
             numpy_type: The numpy type to be converted.
 
@@ -120,3 +203,7 @@ _CAPNP_TO_NUMPY_TYPE = {
     VectorElementType.COMPLEX_FLOAT: np.csingle,
     VectorElementType.COMPLEX_DOUBLE: np.cdouble,
 }
+
+# Cache of already resolved numpy types. Filled on first use of every dtype
+# since resolving through the numpy type hierarchy is comparatively slow.
+_NUMPY_TO_CAPNP_TYPE: dict[np.dtype, VectorElementType] = {}
@@ -37,7 +37,11 @@ from labone.core.resources import (  # type: ignore[attr-defined]
 )
 from labone.core.result import unwrap
 from labone.core.subscription import DataQueue, StreamingHandle
-from labone.core.value import AnnotatedValue
+from labone.core.value import (
+    AnnotatedValue,
+    path_to_capnp,
+    value_from_python_types,
+)
 
 NodeType: TypeAlias = Literal[
     "Integer (64 bit)",
@@ -449,6 +453,35 @@ class KernelSession:
         response = await _send_and_wait_request(request)
         return json.loads(response.nodeProps)
 
+    def _set_value_request(
+        self,
+        value: AnnotatedValue,
+        lookup_mode: session_protocol_capnp.LookupMode,
+    ) -> capnp.lib.capnp._Request:  # noqa: SLF001
+        """Create a setValue request for the given value.
+
+        The value is packed directly into the request instead of going
+        through `AnnotatedValue.to_capnp`, which would require copying the
+        whole value (e.g. a large vector) into the request a second time.
+
+        Args:
+            value: Value to be set.
+            lookup_mode: Lookup mode used by the server to resolve the path.
+
+        Returns:
+            The ready to send request.
+
+        Raises:
+            TypeError: If the node path is of wrong type.
+            LabOneCoreError: If the node value type is not supported.
+        """
+        request = self._session.setValue_request()
+        path_to_capnp(value.path, request, "pathExpression")
+        value_from_python_types(value.value, request.value)
+        request.lookupMode = lookup_mode
+        request.client = self._client_id.bytes
+        return request
+
     async def set(self, value: AnnotatedValue) -> AnnotatedValue:  # noqa: A003
         """Set the value of a node.
 
@@ -468,12 +501,10 @@ class KernelSession:
             LabOneCoreError: If the node value type is not supported.
             LabOneConnectionError: If there is a problem in the connection.
         """
-        capnp_value = value.to_capnp()
-        request = self._session.setValue_request()
-        request.pathExpression = capnp_value.metadata.path
-        request.value = capnp_value.value
-        request.lookupMode = session_protocol_capnp.LookupMode.directLookup
-        request.client = self._client_id.bytes
+        request = self._set_value_request(
+            value,
+            session_protocol_capnp.LookupMode.directLookup,
+        )
         response = await _send_and_wait_request(request)
         return AnnotatedValue.from_capnp(result.unwrap(response.result[0]))
 
@@ -506,12 +537,10 @@ class KernelSession:
             LabOneCoreError: If the node value type is not supported.
             LabOneConnectionError: If there is a problem in the connection.
         """
-        capnp_value = value.to_capnp()
-        request = self._session.setValue_request()
-        request.pathExpression = capnp_value.metadata.path
-        request.value = capnp_value.value
-        request.lookupMode = session_protocol_capnp.LookupMode.withExpansion
-        request.client = self._client_id.bytes
+        request = self._set_value_request(
+            value,
+            session_protocol_capnp.LookupMode.withExpansion,
+        )
         response = await _send_and_wait_request(request)
         return [
             AnnotatedValue.from_capnp(result.unwrap(raw_result))
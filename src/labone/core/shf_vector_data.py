@@ -18,7 +18,12 @@ from typing import TYPE_CHECKING, Union
 
 import numpy as np
 
-from labone.core.helper import VectorElementType, VectorValueType
+from labone.core.helper import (
+    VectorElementType,
+    VectorValueType,
+    array_from_data_view,
+    data_field_view,
+)
 
 if TYPE_CHECKING:
     from labone.core.resources import (  # type: ignore[attr-defined]
@@ -63,7 +68,7 @@ class ShfResultLoggerVectorExtraHeader:
 
     @staticmethod
     def from_binary(
-        binary: bytes,
+        binary: bytes | memoryview,
         *,
         version: _HeaderVersion,
     ) -> ShfResultLoggerVectorExtraHeader:
@@ -137,7 +142,7 @@ class ShfScopeVectorExtraHeader:
 
     @staticmethod
     def from_binary(
-        binary: bytes,
+        binary: bytes | memoryview,
         *,
         version: _HeaderVersion,
     ) -> ShfScopeVectorExtraHeader:
@@ -232,7 +237,7 @@ class ShfDemodulatorVectorExtraHeader:
 
     @staticmethod
     def from_binary(
-        binary: bytes,
+        binary: bytes | memoryview,
         *,
         version: _HeaderVersion,
     ) -> ShfDemodulatorVectorExtraHeader:
@@ -322,8 +327,27 @@ def _parse_extra_header_version(extra_header_info: int) -> _HeaderVersion:
     return _HeaderVersion(major=(version & 0xE0) >> 5, minor=version & 0x1F)
 
 
+def _interleaved_to_complex(data: np.ndarray) -> np.ndarray:
+    """Interpret interleaved real and imaginary parts as complex numbers.
+
+    A contiguous float64 array of alternating real and imaginary parts has
+    the same memory layout as a complex128 array. Reinterpreting the buffer
+    avoids the temporaries of computing `real + 1j * imag`.
+
+    Args:
+        data: Contiguous float64 array of alternating real and imaginary parts.
+
+    Returns:
+        Complex view on the data.
+
+    Raises:
+        ValueError: If the data does not contain an even number of elements.
+    """
+    return data.view(np.complex128)
+
+
 def _deserialize_shf_waveform_vector(
-    raw_data: bytes,
+    raw_data: bytes | memoryview,
 ) -> np.ndarray:
     """Deserialize the vector data for waveform vectors.
 
@@ -339,14 +363,12 @@ def _deserialize_shf_waveform_vector(
     scaling = 1 / float((1 << shf_wavforms_signed_encoding_bits) - 1)
 
     data = np.frombuffer(raw_data, dtype=np.int32) * scaling
-    data_real = data[::2]
-    data_imag = data[1::2]
-    return data_real + 1j * data_imag
+    return _interleaved_to_complex(data)
 
 
 def _deserialize_shf_result_logger_vector(
     *,
-    raw_data: bytes,
+    raw_data: bytes | memoryview,
     extra_header_info: int,
     header_length: int,
     element_type: VectorElementType,
@@ -371,7 +393,7 @@ def _deserialize_shf_result_logger_vector(
     )
 
     # Parse raw data
-    data = np.frombuffer(
+    data = array_from_data_view(
         raw_data[header_length:],
         dtype=element_type.to_numpy_type(),
     )
@@ -380,7 +402,7 @@ def _deserialize_shf_result_logger_vector(
 
 def _deserialize_shf_scope_vector(
     *,
-    raw_data: bytes,
+    raw_data: bytes | memoryview,
     extra_header_info: int,
     header_length: int,
 ) -> tuple[np.ndarray, ShfScopeVectorExtraHeader]:
@@ -406,14 +428,12 @@ def _deserialize_shf_scope_vector(
     data = (
         np.frombuffer(raw_data[header_length:], dtype=np.int32) * extra_header.scaling
     )
-    data_real = data[::2]
-    data_imag = data[1::2]
-    return data_real + 1j * data_imag, extra_header
+    return _interleaved_to_complex(data), extra_header
 
 
 def _deserialize_shf_demodulator_vector(
     *,
-    raw_data: bytes,
+    raw_data: bytes | memoryview,
     extra_header_info: int,
     header_length: int,
 ) -> tuple[SHFDemodSample, ShfDemodulatorVectorExtraHeader]:
@@ -474,7 +494,7 @@ def parse_shf_vector_data_struct(
     Raises:
         ValueError: If the vector value type is not supported.
     """
-    raw_data = vector_data.data
+    raw_data = data_field_view(vector_data, "data")
     extra_header_info: int = vector_data.extraHeaderInfo
     header_length = get_header_length(vector_data)
 
@@ -239,59 +239,65 @@ class StreamingHandle(session_protocol_capnp.StreamingHandle.Server):
     def _add_to_data_queue(
         self,
         data_queue: DataQueue | None,
-        value: AnnotatedValue,
+        values: list[AnnotatedValue],
     ) -> bool:
-        """Add a value to the data queue.
+        """Add a batch of values to the data queue.
 
-        The value is added to the queue non blocking, meaning that if the queue
-        is full, an error is raised.
+        The values are added to the queue non blocking, meaning that if the
+        queue is full, an error is raised.
 
         Args:
-            data_queue: The data queue to which the value will be added.
-            value: The value to add to the data queue.
+            data_queue: The data queue to which the values will be added.
+            values: The values to add to the data queue.
+
+        Returns:
+            Whether the data queue is still able to receive values.
 
         Raises:
             StreamingError: If the data queue is full or disconnected.
             AttributeError: If the data queue has been garbage collected.
         """
-        if data_queue is None or data_queue.full():
-            logger.warning(
-                "Data queue %s is full. No more data will be pushed to the data queue.",
-                hex(id(data_queue)),
-            )
-            data_queue.disconnect()  # type: ignore[union-attr] # supposed to throw
-            return False
-        try:
-            data_queue.put_nowait(value)
-        except errors.StreamingError:
-            logger.debug(
-                "Data queue %s has disconnected. Removing from list of data queues.",
-                hex(id(data_queue)),
-            )
-            return False
+        for value in values:
+            if data_queue is None or data_queue.full():
+                logger.warning(
+                    "Data queue %s is full. No more data will be pushed to the "
+                    "data queue.",
+                    hex(id(data_queue)),
+                )
+                data_queue.disconnect()  # type: ignore[union-attr] # supposed to throw
+                return False
+            try:
+                data_queue.put_nowait(value)
+            except errors.StreamingError:
+                logger.debug(
+                    "Data queue %s has disconnected. Removing from list of data "
+                    "queues.",
+                    hex(id(data_queue)),
+                )
+                return False
         return True
 
     def _distribute_to_data_queues(
         self,
-        value: session_protocol_capnp.AnnotatedValue,
+        values: list[AnnotatedValue],
     ) -> None:
-        """Add a value to all data queues.
+        """Add a batch of values to all data queues.
 
-        The value is added to the queue non blocking, meaning that if the queue
-        is full, an error is raised.
+        The values are added to the queue non blocking, meaning that if the
+        queue is full, an error is raised. The list of registered data queues
+        is only pruned once per batch.
 
         Args:
-            value: The value to add to the data queue.
+            values: The values to add to the data queues.
 
         Raises:
             capnp.KjException: If no data queues are registered any more and
                 the subscription should be removed.
         """
-        parsed_value = AnnotatedValue.from_capnp(value)
         self._data_queues = [
             data_queue
             for data_queue in self._data_queues
-            if self._add_to_data_queue(data_queue(), parsed_value)
+            if self._add_to_data_queue(data_queue(), values)
         ]
         if not self._data_queues:
             # TODO(tobiasa): The kernel expects a KjException of type # noqa: FIX002
@@ -321,4 +327,11 @@ class StreamingHandle(session_protocol_capnp.StreamingHandle.Server):
             capnp.KjException: If no data queues are registered any more and
                 the subscription should be removed.
         """
-        list(map(self._distribute_to_data_queues, values))
+        parsed_values = []
+        try:
+            for value in values:
+                parsed_values.append(AnnotatedValue.from_capnp(value))  # noqa: PERF401
+        finally:
+            # Values parsed before a failing one are still delivered.
+            if parsed_values:
+                self._distribute_to_data_queues(parsed_values)
@@ -8,8 +8,9 @@ versa.
 from __future__ import annotations
 
 import logging
+import sys
 from dataclasses import dataclass
-from typing import Any, Union
+from typing import Any, Callable, Union
 
 import capnp
 import numpy as np
@@ -18,6 +19,8 @@ from labone.core.helper import (
     LabOneNodePath,
     VectorElementType,
     VectorValueType,
+    array_from_data_view,
+    data_field_view,
     request_field_type_description,
 )
 from labone.core.resources import session_protocol_capnp  # type: ignore[attr-defined]
@@ -30,8 +33,13 @@ from labone.core.shf_vector_data import (
 
 logger = logging.getLogger(__name__)
 
+# Instances of the value classes are created for every received value.
+# Slots avoid a `__dict__` per instance but are only supported by dataclasses
+# from python 3.10 on.
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_DATACLASS_OPTIONS)
 class AnnotatedValue:
     """Python representation of a node value.
 
@@ -67,10 +75,15 @@ class AnnotatedValue:
             The converted AnnotatedValue.
         """
         value, extra_header = _capnp_value_to_python_value(raw.value)
+        # Every attribute access on a capnp struct goes through the capnp
+        # reflection layer, so the metadata struct is only resolved once.
+        metadata = raw.metadata
         return AnnotatedValue(
             value=value,
-            timestamp=raw.metadata.timestamp,
-            path=raw.metadata.path,
+            # Subscriptions receive the same path for every value. Interning
+            # lets all of them share a single string object.
+            path=sys.intern(metadata.path),
+            timestamp=metadata.timestamp,
             extra_header=extra_header,
         )
 
@@ -91,17 +104,12 @@ class AnnotatedValue:
             LabOneCoreError: If the data type of the value to be set is not supported.
         """
         message = session_protocol_capnp.AnnotatedValue.new_message()
-        try:
-            message.metadata.path = self.path
-        except (AttributeError, TypeError, capnp.KjException):
-            field_type = request_field_type_description(message.metadata, "path")
-            msg = f"`path` attribute must be of type {field_type}."
-            raise TypeError(msg) from None
-        message.value = _value_from_python_types(self.value)
+        path_to_capnp(self.path, message.metadata, "path")
+        value_from_python_types(self.value, message.value)
         return message
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class TriggerSample:
     """Single trigger sample.
 
@@ -144,7 +152,7 @@ class TriggerSample:
         )
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class CntSample:
     """Single counter sample.
 
@@ -191,7 +199,7 @@ Value = Union[
 
 def _capnp_vector_to_value(
     vector_data: session_protocol_capnp.VectorData,
-) -> tuple[np.ndarray | SHFDemodSample, ExtraHeader | None]:
+) -> tuple[np.ndarray | SHFDemodSample | str, ExtraHeader | None]:
     """Parse a capnp vector to a numpy array.
 
     In addition to the numpy array the function also returns the extra header
@@ -205,7 +213,7 @@ def _capnp_vector_to_value(
     Returns:
         Numpy array containing the vector data and the extra header if present.
     """
-    raw_data = vector_data.data
+    raw_data = data_field_view(vector_data, "data")
     element_type = VectorElementType(vector_data.vectorElementType)
     generic_vector_types = [VectorValueType.VECTOR_DATA, VectorValueType.BYTE_ARRAY]
     if vector_data.valueType not in generic_vector_types:
@@ -219,17 +227,55 @@ def _capnp_vector_to_value(
             # still return the data without the extra header info.
             logger.exception("Unknown shf vector type.")
             bytes_to_skip = get_header_length(vector_data)
-            parse_vector = np.frombuffer(
+            parse_vector = array_from_data_view(
                 raw_data[bytes_to_skip:],
                 dtype=element_type.to_numpy_type(),
             )
             return parse_vector, None
 
     if element_type == VectorElementType.STRING:
-        # Special case for strings which are send as byte arrays
-        return raw_data.decode(), None
+        # Special case for strings which are send as byte arrays. Decoding
+        # straight from the buffer avoids an intermediate bytes object.
+        return str(raw_data, "utf-8"), None
+
+    return (
+        array_from_data_view(raw_data, dtype=element_type.to_numpy_type()),
+        None,
+    )
+
+
+def _capnp_complex_to_value(capnp_complex: session_protocol_capnp.Complex) -> complex:
+    """Convert a capnp complex struct to a python complex.
+
+    Args:
+        capnp_complex: The capnp complex to convert.
+
+    Returns:
+        The converted complex number.
+    """
+    return complex(capnp_complex.real, capnp_complex.imag)
+
 
-    return np.frombuffer(raw_data, dtype=element_type.to_numpy_type()), None
+# Parser per capnp value type, keyed by the name of the active union field.
+_CAPNP_VALUE_PARSERS: dict[
+    str,
+    Callable[[Any], tuple[Value, ExtraHeader | None]],
+] = {
+    "int64": lambda capnp_value: (capnp_value.int64, None),
+    "double": lambda capnp_value: (capnp_value.double, None),
+    "complex": lambda capnp_value: (_capnp_complex_to_value(capnp_value.complex), None),
+    "string": lambda capnp_value: (capnp_value.string, None),
+    "vectorData": lambda capnp_value: _capnp_vector_to_value(capnp_value.vectorData),
+    "cntSample": lambda capnp_value: (
+        CntSample.from_capnp(capnp_value.cntSample),
+        None,
+    ),
+    "triggerSample": lambda capnp_value: (
+        TriggerSample.from_capnp(capnp_value.triggerSample),
+        None,
+    ),
+    "none": lambda _: (None, None),
+}
 
 
 def _capnp_value_to_python_value(
@@ -246,73 +292,213 @@ def _capnp_value_to_python_value(
     Raises:
         ValueError: If the capnp value has an unknown type.
     """
-    capnp_type = capnp_value.which()
-    if capnp_type == "int64":
-        return capnp_value.int64, None
-    if capnp_type == "double":
-        return capnp_value.double, None
-    if capnp_type == "complex":
-        return complex(capnp_value.complex.real, capnp_value.complex.imag), None
-    if capnp_type == "string":
-        return capnp_value.string, None
-    if capnp_type == "vectorData":
-        return _capnp_vector_to_value(capnp_value.vectorData)
-    if capnp_type == "cntSample":
-        return CntSample.from_capnp(capnp_value.cntSample), None
-    if capnp_type == "triggerSample":
-        return TriggerSample.from_capnp(capnp_value.triggerSample), None
-    if capnp_type == "none":
-        return None, None
-    msg = f"Unknown capnp type: {capnp_type}"
-    raise ValueError(msg)
-
-
-def _value_from_python_types(
-    value: Any,  # noqa: ANN401
-) -> capnp.lib.capnp._DynamicStructBuilder:  # noqa: SLF001
-    """Create `session_protocol_capnp.Value` builder from Python types.
+    # Depending on the pycapnp version `which` returns a string or an enum
+    # field, both convert to the name of the active union field.
+    capnp_type = str(capnp_value.which())
+    try:
+        parser = _CAPNP_VALUE_PARSERS[capnp_type]
+    except KeyError:
+        msg = f"Unknown capnp type: {capnp_type}"
+        raise ValueError(msg) from None
+    return parser(capnp_value)
+
+
+_ValueSetter = Callable[[Any, Any], None]
+
+
+def _set_int64(request_value: Any, value: Any) -> None:  # noqa: ANN401
+    """Pack an integer (including bool and numpy integers) as int64.
 
     Args:
-        value: The value to be converted.
+        request_value: Capnp value builder to write to.
+        value: The value to be packed.
+    """
+    # Explicit conversion since capnp does not accept all numpy scalar types.
+    request_value.int64 = int(value)
+
+
+def _set_double(request_value: Any, value: Any) -> None:  # noqa: ANN401
+    """Pack a float (including numpy floats) as double.
+
+    Args:
+        request_value: Capnp value builder to write to.
+        value: The value to be packed.
+    """
+    request_value.double = float(value)
+
+
+def _set_complex(request_value: Any, value: complex) -> None:  # noqa: ANN401
+    """Pack a complex number into the complex struct.
+
+    Args:
+        request_value: Capnp value builder to write to.
+        value: The value to be packed.
+    """
+    complex_value = request_value.init("complex")
+    complex_value.real = value.real
+    complex_value.imag = value.imag
+
+
+def _set_string(request_value: Any, value: str) -> None:  # noqa: ANN401
+    """Pack a string.
+
+    Args:
+        request_value: Capnp value builder to write to.
+        value: The value to be packed.
+    """
+    request_value.string = value
+
+
+def _set_bytes(request_value: Any, value: bytes) -> None:  # noqa: ANN401
+    """Pack bytes as a byte array vector.
+
+    Args:
+        request_value: Capnp value builder to write to.
+        value: The value to be packed.
+    """
+    vector_data = request_value.init("vectorData")
+    vector_data.valueType = VectorValueType.BYTE_ARRAY.value
+    vector_data.extraHeaderInfo = 0
+    vector_data.vectorElementType = VectorElementType.UINT8.value
+    vector_data.data = value
+
+
+def _set_ndarray(request_value: Any, value: np.ndarray) -> None:  # noqa: ANN401
+    """Pack a numpy array as a generic vector.
+
+    Args:
+        request_value: Capnp value builder to write to.
+        value: The value to be packed.
+
+    Raises:
+        ValueError: If the dtype of the array is not supported.
+    """
+    element_type = VectorElementType.from_numpy_type(value.dtype)
+    vector_data = request_value.init("vectorData")
+    vector_data.valueType = VectorValueType.VECTOR_DATA.value
+    vector_data.extraHeaderInfo = 0
+    vector_data.vectorElementType = element_type.value
+    if type(value) is np.ndarray and value.flags.c_contiguous:
+        # Passing the buffer directly avoids the intermediate copy of
+        # `tobytes()`. capnp copies the data into the message right away.
+        try:
+            vector_data.data = value.data
+        except (TypeError, capnp.KjException):
+            # pycapnp versions without memoryview support for `Data` fields.
+            vector_data.data = value.tobytes()
+    else:
+        # Subclasses may define their own serialization (e.g. masked arrays
+        # replace masked entries with the fill value).
+        vector_data.data = value.tobytes()
+
+
+def _resolve_value_setter(value_type: type) -> _ValueSetter | None:
+    """Find the function that packs values of a given type into capnp.
+
+    Args:
+        value_type: Type of the value to be packed.
 
     Returns:
-        A new message builder for `labone.core.resources.session_protocol_capnp:Value`.
+        The matching setter or None if the type is not supported.
+    """
+    # Ordered by how common the types are. Note that `bool` is covered by
+    # the `int` check and packed as int64.
+    if issubclass(value_type, np.ndarray):
+        return _set_ndarray
+    if issubclass(value_type, (float, np.floating)):
+        return _set_double
+    if issubclass(value_type, (int, np.integer)):
+        return _set_int64
+    if issubclass(value_type, bytes):
+        return _set_bytes
+    if issubclass(value_type, str):
+        return _set_string
+    if issubclass(value_type, complex):
+        return _set_complex
+    return None
+
+
+# Setter per concrete value type. Builtin and numpy types are added on first
+# use so that the type checks only run once per type. Other types (e.g.
+# subclasses defined at runtime) are resolved on every call instead of being
+# kept alive by this table.
+_CACHEABLE_TYPE_MODULES = ("builtins", "numpy")
+_VALUE_SETTERS: dict[type, _ValueSetter] = {
+    value_type: _resolve_value_setter(value_type)  # type: ignore[misc]
+    for value_type in (
+        bool,
+        int,
+        float,
+        complex,
+        str,
+        bytes,
+        np.ndarray,
+        np.int8,
+        np.int16,
+        np.int32,
+        np.int64,
+        np.uint8,
+        np.uint16,
+        np.uint32,
+        np.uint64,
+        np.float16,
+        np.float32,
+        np.float64,
+        np.complex128,
+    )
+}
+
+
+def path_to_capnp(
+    path: LabOneNodePath,
+    capnp_struct: capnp.lib.capnp._DynamicStructBuilder,  # noqa: SLF001
+    field: str,
+) -> None:
+    """Write a node path into a field of a capnp struct builder.
+
+    Args:
+        path: The node path to be written.
+        capnp_struct: Builder of the struct (or request) containing the field.
+        field: Name of the path field.
+
+    Raises:
+        TypeError: If the path is of wrong type.
+    """
+    try:
+        setattr(capnp_struct, field, path)
+    except (AttributeError, TypeError, capnp.KjException):
+        field_type = request_field_type_description(capnp_struct, field)
+        msg = f"`path` attribute must be of type {field_type}."
+        raise TypeError(msg) from None
+
+
+def value_from_python_types(
+    value: Any,  # noqa: ANN401
+    capnp_value: capnp.lib.capnp._DynamicStructBuilder,  # noqa: SLF001
+) -> None:
+    """Pack a Python value into a `session_protocol_capnp.Value` builder.
+
+    The value is written in place into the given builder. This avoids
+    creating a standalone message that would need to be copied into the
+    parent message afterwards.
+
+    Args:
+        value: The value to be converted.
+        capnp_value: Builder for `labone.core.resources.session_protocol_capnp:Value`
+            the value is written to.
 
     Raises:
         LabOneCoreError: If the data type of the value to be set is not supported.
     """
-    request_value = session_protocol_capnp.Value.new_message()
-    if isinstance(value, bool):
-        request_value.int64 = int(value)
-    elif np.issubdtype(type(value), np.integer):
-        request_value.int64 = value
-    elif np.issubdtype(type(value), np.floating):
-        request_value.double = value
-    elif isinstance(value, complex):
-        request_value.complex = session_protocol_capnp.Complex(
-            real=value.real,
-            imag=value.imag,
-        )
-    elif isinstance(value, str):
-        request_value.string = value
-    elif isinstance(value, bytes):
-        request_value.vectorData = session_protocol_capnp.VectorData(
-            valueType=VectorValueType.BYTE_ARRAY.value,
-            extraHeaderInfo=0,
-            vectorElementType=VectorElementType.UINT8.value,
-            data=value,
-        )
-    elif isinstance(value, np.ndarray):
-        vector_data = session_protocol_capnp.VectorData(
-            valueType=VectorValueType.VECTOR_DATA.value,
-            extraHeaderInfo=0,
-            vectorElementType=VectorElementType.from_numpy_type(value.dtype).value,
-            data=value.tobytes(),
-        )
-        request_value.vectorData = vector_data
-    else:
-        msg = f"The provided value has an invalid type: {type(value)}"
-        raise ValueError(
-            msg,
-        )
-    return request_value
+    value_type = type(value)
+    setter = _VALUE_SETTERS.get(value_type)
+    if setter is None:
+        setter = _resolve_value_setter(value_type)
+        if setter is None:
+            msg = f"The provided value has an invalid type: {value_type}"
+            raise ValueError(
+                msg,
+            )
+        if value_type.__module__ in _CACHEABLE_TYPE_MODULES:
+            _VALUE_SETTERS[value_type] = setter
+    setter(capnp_value, value)
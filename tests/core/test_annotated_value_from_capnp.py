@@ -4,6 +4,7 @@ from unittest.mock import patch
 import labone.core.value as value_module
 import numpy as np
 import pytest
+from labone.core.helper import array_from_data_view, data_field_view
 from labone.core.resources import session_protocol_capnp
 
 
@@ -147,6 +148,25 @@ def test_string_vector():
     assert parsed_value.value == "Hello World"
 
 
+def test_string_vector_utf8():
+    input_string = "Grüezi \u03bcs \U0001f600"
+    input_dict = {
+        "metadata": {"timestamp": 42, "path": "/non/of/your/business"},
+        "value": {
+            "vectorData": {
+                "valueType": 7,
+                "vectorElementType": 6,
+                "extraHeaderInfo": 0,
+                "data": input_string.encode("utf-8"),
+            },
+        },
+    }
+    msg = session_protocol_capnp.AnnotatedValue.new_message()
+    msg.from_dict(input_dict)
+    parsed_value = value_module.AnnotatedValue.from_capnp(msg)
+    assert parsed_value.value == input_string
+
+
 def test_generic_vector():
     input_array = np.array([1, 2, 3, 4, 5, 6, 7, 8], dtype=np.uint32)
     input_dict = {
@@ -169,6 +189,43 @@ def test_generic_vector():
     assert np.array_equal(parsed_value.value, input_array)
 
 
+def test_generic_vector_owns_data():
+    input_array = np.array([1, 2, 3, 4], dtype=np.uint64)
+    input_dict = {
+        "metadata": {"timestamp": 42, "path": "/non/of/your/business"},
+        "value": {
+            "vectorData": {
+                "valueType": 67,
+                "vectorElementType": 3,
+                "extraHeaderInfo": 0,
+                "data": input_array.tobytes(),
+            },
+        },
+    }
+    msg = session_protocol_capnp.AnnotatedValue.new_message()
+    msg.from_dict(input_dict)
+    parsed_value = value_module.AnnotatedValue.from_capnp(msg.as_reader())
+    del msg
+    array = parsed_value.value
+    assert array.flags.owndata or isinstance(array.base.obj, bytes)
+    assert np.array_equal(array, input_array)
+
+
+def test_generic_vector_without_buffer_export_is_not_copied():
+    input_array = np.array([1, 2, 3, 4], dtype=np.uint64)
+
+    class LegacyVectorData:
+        # pycapnp versions without `get_data_as_view` return a bytes copy.
+        data = input_array.tobytes()
+
+    array = array_from_data_view(
+        data_field_view(LegacyVectorData(), "data"),
+        dtype=np.uint64,
+    )
+    assert not array.flags.owndata
+    assert np.array_equal(array, input_array)
+
+
 def test_shf_vector():
     input_dict = {
         "metadata": {"timestamp": 42, "path": "/non/of/your/business"},
@@ -228,3 +285,15 @@ def test_unknown_shf_vector(vector_length, header_length):
     assert parsed_value.path == input_dict["metadata"]["path"]
     assert parsed_value.extra_header is None
     assert np.array_equal(parsed_value.value, input_array[header_length:])
+
+
+def test_path_is_interned():
+    input_dict = {
+        "metadata": {"timestamp": 42, "path": "/dev1234/demods/0/sample"},
+        "value": {"int64": 1},
+    }
+    msg = session_protocol_capnp.AnnotatedValue.new_message()
+    msg.from_dict(input_dict)
+    first = value_module.AnnotatedValue.from_capnp(msg)
+    second = value_module.AnnotatedValue.from_capnp(msg)
+    assert first.path is second.path
@@ -4,6 +4,8 @@ NOTE: `capnp` builder instances cannot be asserter for equality.
 
 TODO: Tests for invalid Python value cases.
 """
+import capnp
+import labone.core.value as value_module
 import numpy as np
 import pytest
 from hypothesis import given
@@ -150,6 +152,44 @@ def test_value_from_python_types_vector_data_complex_double(inp):
     assert vec_data.data == inp.tobytes()
 
 
+@given(arrays(dtype=np.double, shape=(4, 3)))
+def test_value_from_python_types_vector_data_non_contiguous(inp):
+    value = AnnotatedValue(value=inp.T, path="").to_capnp()
+    vec_data = value.value.vectorData
+    assert vec_data.vectorElementType == VectorElementType.DOUBLE.value
+    assert vec_data.data == inp.T.tobytes()
+
+
+def test_value_from_python_types_vector_data_masked_array():
+    inp = np.ma.masked_array([1.0, 2.0, 3.0], mask=[False, True, False])
+    value = AnnotatedValue(value=inp, path="").to_capnp()
+    vec_data = value.value.vectorData
+    assert vec_data.vectorElementType == VectorElementType.DOUBLE.value
+    assert vec_data.data == inp.tobytes()
+    assert vec_data.data != inp.data.tobytes()
+
+
+def test_value_from_python_types_vector_data_memoryview_rejected():
+    class LegacyVectorData:
+        # pycapnp versions that only accept bytes for `Data` fields.
+        def __setattr__(self, name, value):
+            if name == "data" and not isinstance(value, bytes):
+                raise capnp.KjException(message="Value type mismatch")
+            super().__setattr__(name, value)
+
+    class LegacyValue:
+        def __init__(self):
+            self.vector_data = LegacyVectorData()
+
+        def init(self, _):
+            return self.vector_data
+
+    inp = np.array([1.0, 2.0, 3.0])
+    request_value = LegacyValue()
+    value_module.value_from_python_types(inp, request_value)
+    assert request_value.vector_data.data == inp.tobytes()
+
+
 @given(arrays(dtype=(np.string_), shape=(1, 2)))
 def test_value_from_python_types_vector_data_invalid(inp):
     with pytest.raises(ValueError):
@@ -162,3 +202,24 @@ def test_value_from_python_types_invalid():
 
     with pytest.raises(ValueError):
         AnnotatedValue(value=FakeObject, path="").to_capnp()
+
+
+def test_value_from_python_types_new_type_is_cached():
+    value_module._VALUE_SETTERS.pop(np.longlong, None)
+    value = AnnotatedValue(value=np.longlong(42), path="").to_capnp()
+    assert value.value.int64 == 42
+    assert np.longlong in value_module._VALUE_SETTERS
+
+
+def test_value_from_python_types_builtin_subclasses():
+    class CustomInt(int):
+        pass
+
+    class CustomFloat(float):
+        pass
+
+    assert AnnotatedValue(value=CustomInt(3), path="").to_capnp().value.int64 == 3
+    value = AnnotatedValue(value=CustomFloat(1.5), path="").to_capnp()
+    assert value.value.double == 1.5
+    assert CustomInt not in value_module._VALUE_SETTERS
+    assert CustomFloat not in value_module._VALUE_SETTERS
@@ -242,3 +242,13 @@ def test_shf_waveform_logger_vector(vector_length, x, y):
         + 1j * const_scaling * y * np.ones(vector_length, dtype=np.complex128),
     )
     assert extra_header is None
+
+
+def test_shf_waveform_logger_vector_odd_length():
+    input_vector = session_protocol_capnp.VectorData.new_message()
+    input_vector.valueType = VectorValueType.SHF_GENERATOR_WAVEFORM_VECTOR_DATA.value
+    input_vector.vectorElementType = 2  # uint32
+    input_vector.extraHeaderInfo = 0
+    input_vector.data = struct.pack("I", 1) * 3
+    with pytest.raises(ValueError):
+        parse_shf_vector_data_struct(input_vector)
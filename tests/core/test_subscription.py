@@ -286,3 +286,44 @@ async def test_streaming_handle_update_queue_full_multiple():
     values.append(value)
     with pytest.raises(capnp.KjException):
         await streaming_handle.sendValues(values)
+
+
+@pytest.mark.asyncio()
+async def test_streaming_handle_update_queue_full_mid_batch():
+    streaming_handle = StreamingHandle()
+    queue_0 = DataQueue(
+        path="dummy",
+        register_function=streaming_handle.register_data_queue,
+    )
+    queue_1 = DataQueue(
+        path="dummy",
+        register_function=streaming_handle.register_data_queue,
+    )
+    queue_0.maxsize = 2
+    values = []
+    for i in range(3):
+        value = session_protocol_capnp.AnnotatedValue.new_message()
+        value.metadata.path = "dummy"
+        value.value.int64 = i
+        values.append(value)
+    await streaming_handle.sendValues(values)
+    assert queue_0.qsize() == 2
+    assert not queue_0.connected
+    assert queue_1.qsize() == 3
+    assert len(streaming_handle._data_queues) == 1
+
+
+@pytest.mark.asyncio()
+async def test_streaming_handle_update_invalid_value_delivers_previous():
+    streaming_handle = StreamingHandle()
+    queue = DataQueue(
+        path="dummy",
+        register_function=streaming_handle.register_data_queue,
+    )
+    value = session_protocol_capnp.AnnotatedValue.new_message()
+    value.metadata.path = "dummy"
+    value.value.int64 = 1
+    with pytest.raises(AttributeError):
+        await streaming_handle.sendValues([value, object()])
+    assert queue.qsize() == 1
+    assert queue.get_nowait().value == 1